@@ -10,3 +10,4 @@
 from pathlib import Path
 
 EXTENSION_ROOT = Path(__file__).resolve().parents[1].joinpath("extensions")
+EXTENSION_CACHE_FILE = Path.home().joinpath(".cache", "kiauh", "ext_discovery.json")
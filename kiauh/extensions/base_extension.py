@@ -7,15 +7,34 @@
 #  This file may be distributed under the terms of the GNU GPLv3 license  #
 # ======================================================================= #
 
+import inspect
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, Type
 
 
 # noinspection PyUnusedLocal
 # noinspection PyMethodMayBeStatic
 class BaseExtension(ABC):
+    # maps the module path of each extension to its concrete extension class
+    _registry: Dict[str, Type["BaseExtension"]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if inspect.isabstract(cls):
+            return
+        # same qualname means the module was reloaded, which is not a conflict
+        registered = BaseExtension._registry.get(cls.__module__)
+        if registered is not None and registered.__qualname__ != cls.__qualname__:
+            raise TypeError(
+                f"Module {cls.__module__} defines more than one extension: "
+                f"{registered.__qualname__}, {cls.__qualname__}"
+            )
+        BaseExtension._registry[cls.__module__] = cls
+
     def __init__(self, metadata: Dict[str, str]):
         self.metadata = metadata
+        self.display_name = metadata.get("display_name")
+        self.index = metadata.get("index")
 
     @abstractmethod
     def install_extension(self, **kwargs) -> None:
@@ -9,20 +9,129 @@
 from __future__ import annotations
 
 import importlib
-import inspect
 import json
+import os
+import tempfile
 import textwrap
-from pathlib import Path
-from typing import Dict, List, Type
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Type
 
 from core.logger import Logger
 from core.menus import Option
 from core.menus.base_menu import BaseMenu
 from core.types.color import Color
-from extensions import EXTENSION_ROOT
+from extensions import EXTENSION_CACHE_FILE, EXTENSION_ROOT
 from extensions.base_extension import BaseExtension
 from utils.input_utils import get_selection_input, get_confirm
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+
+def _load_discovery_cache() -> Dict[str, Any]:
+    try:
+        cache = _loads(EXTENSION_CACHE_FILE.read_bytes())
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_discovery_cache(cache: Dict[str, Any]) -> None:
+    tmp_path = None
+    try:
+        EXTENSION_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temp file first, so concurrent runs never read a partial file
+        with tempfile.NamedTemporaryFile(
+            "w", dir=EXTENSION_CACHE_FILE.parent, suffix=".tmp", delete=False
+        ) as c:
+            tmp_path = c.name
+            json.dump(cache, c)
+        os.replace(tmp_path, EXTENSION_CACHE_FILE)
+    except OSError as e:
+        Logger.print_warn(f"Unable to write extension cache: {e}")
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _is_cache_hit(cached: Any, mtime_ns: int) -> bool:
+    return (
+        isinstance(cached, dict)
+        and cached.get("mtime_ns") == mtime_ns
+        and isinstance(cached.get("module_path"), str)
+        and isinstance(cached.get("metadata"), dict)
+    )
+
+
+_LINE1 = Color.apply("Available Extensions:", Color.YELLOW)
+_LINE2 = Color.apply("I) Bulk Install Extensions", Color.GREEN)
+_HDR_BULK = Color.apply("=== Bulk Extension Installation ===", Color.CYAN)
+_HDR_INSTR = Color.apply("Instructions:", Color.YELLOW)
+_HDR_SELECTED = Color.apply("Selected extensions for installation:", Color.YELLOW)
+_HDR_START = Color.apply("Starting bulk installation...", Color.GREEN)
+_HDR_SUMMARY = Color.apply("=== Installation Summary ===", Color.CYAN)
+_PROMPT_SELECT = Color.apply("Select extensions (or 'done' to proceed): ", Color.CYAN)
+_MSG_ALL_OK = Color.apply("All extensions installed successfully! 🎉", Color.GREEN)
+_ROW = "║ {:<53} ║\n".format
+_MENU_MID_SEP = "╟───────────────────────────────────────────────────────╢\n"
+_MENU_HEADER = textwrap.dedent(
+    f"""
+    ╟───────────────────────────────────────────────────────╢
+    ║ {_LINE1:<62} ║
+    ║                                                       ║
+    """
+)[1:]
+_MENU_FOOTER = textwrap.dedent(
+    f"""
+    ║                                                       ║
+    ║ {_LINE2:<62} ║
+    ╟───────────────────────────────────────────────────────╢
+    """
+)[1:]
+
+# maps the path of each metadata.json to its mtime and the discovery result
+_DISCOVERY_CACHE: Dict[str, Any] = _load_discovery_cache()
+
+
+class _LazyExtension:
+    """
+    Placeholder for a discovered extension. The extension module is only
+    imported and the extension instantiated once an attribute other than the
+    metadata is accessed, e.g. when the extension is installed or removed.
+    """
+
+    __slots__ = ("module_path", "metadata", "display_name", "index", "_ext_instance")
+
+    def __init__(self, module_path: str, metadata: Dict[str, Any]):
+        self.module_path = module_path
+        self.metadata = metadata
+        self.display_name = metadata.get("display_name")
+        self.index = metadata.get("index")
+        self._ext_instance: BaseExtension | None = None
+
+    @property
+    def _instance(self) -> BaseExtension:
+        if self._ext_instance is None:
+            self._ext_instance = self._load_extension()
+        return self._ext_instance
+
+    def _load_extension(self) -> BaseExtension:
+        try:
+            importlib.import_module(self.module_path)
+            ext_class = BaseExtension._registry.get(self.module_path)
+            if ext_class is None:
+                raise ImportError(f"No extension class found in {self.module_path}")
+            return ext_class(self.metadata)
+        except (AttributeError, TypeError) as e:
+            # re-raise, as __getattr__ would otherwise mask the actual cause
+            raise ImportError(f"Failed loading {self.module_path}: {e}") from e
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._instance, name)
+
 
 # noinspection PyUnusedLocal
 # noinspection PyMethodMayBeStatic
@@ -32,7 +141,7 @@ class ExtensionsMenu(BaseMenu):
         self.title = "Extensions Menu"
         self.title_color = Color.CYAN
         self.previous_menu: Type[BaseMenu] | None = previous_menu
-        self.extensions: Dict[str, BaseExtension] = self.discover_extensions()
+        self.extensions: Dict[str, _LazyExtension] = self.discover_extensions()
 
     def set_previous_menu(self, previous_menu: Type[BaseMenu] | None) -> None:
         from core.menus.main_menu import MainMenu
@@ -46,139 +155,197 @@ class ExtensionsMenu(BaseMenu):
         }
         self.options["i"] = Option(self.bulk_install_extensions)
 
-    def discover_extensions(self) -> Dict[str, BaseExtension]:
-        ext_dict = {}
-
-        for ext in EXTENSION_ROOT.iterdir():
-            metadata_json = Path(ext).joinpath("metadata.json")
-            if not metadata_json.exists():
-                continue
-
-            try:
-                with open(metadata_json, "r") as m:
-                    # read extension metadata from json
-                    metadata = json.load(m).get("metadata")
-                    module_name = metadata.get("module")
-                    module_path = f"kiauh.extensions.{ext.name}.{module_name}"
-
-                    # get the class name of the extension
-                    module = importlib.import_module(module_path)
-
-                    def predicate(o):
-                        return (
-                            inspect.isclass(o)
-                            and issubclass(o, BaseExtension)
-                            and o != BaseExtension
-                        )
-
-                    ext_class: type = inspect.getmembers(module, predicate)[0][1]
+    def discover_extensions(self) -> Dict[str, _LazyExtension]:
+        ext_dict: Dict[int, _LazyExtension] = {}
+        # rebuilt from the extensions found in this scan to drop stale entries
+        cache: Dict[str, Any] = {}
 
-                    # instantiate the extension with its metadata and add to dict
-                    ext_instance: BaseExtension = ext_class(metadata)
-                    ext_dict[f"{metadata.get('index')}"] = ext_instance
+        with os.scandir(EXTENSION_ROOT) as entries:
+            for ext in entries:
+                if not ext.is_dir():
+                    continue
 
-            except (IOError, json.JSONDecodeError, ImportError) as e:
-                print(f"Failed loading extension {ext}: {e}")
+                metadata_json = os.path.join(ext.path, "metadata.json")
+                try:
+                    mtime_ns = os.stat(metadata_json).st_mtime_ns
+                except FileNotFoundError:
+                    continue
 
-        return dict(sorted(ext_dict.items(), key=lambda x: int(x[0])))
+                try:
+                    cached = _DISCOVERY_CACHE.get(metadata_json) or {}
+                    if _is_cache_hit(cached, mtime_ns):
+                        # reuse the cached metadata instead of reading the json
+                        cache[metadata_json] = cached
+                        metadata = cached["metadata"]
+                        module_path = cached["module_path"]
+                    else:
+                        # read extension metadata from json
+                        with open(metadata_json, "rb") as m:
+                            metadata = _loads(m.read()).get("metadata")
+                        module_name = metadata.get("module")
+                        module_path = f"kiauh.extensions.{ext.name}.{module_name}"
+
+                        cache[metadata_json] = {
+                            "mtime_ns": mtime_ns,
+                            "module_path": module_path,
+                            "metadata": metadata,
+                        }
+
+                    index = metadata.get("index")
+                    if index is None:
+                        print(f"Failed loading extension {ext.path}: missing index")
+                        continue
+
+                    # the extension module is imported on first use only
+                    ext_dict[int(index)] = _LazyExtension(module_path, metadata)
+
+                except (IOError, json.JSONDecodeError, TypeError, ValueError) as e:
+                    print(f"Failed loading extension {ext.path}: {e}")
+
+        if cache != _DISCOVERY_CACHE:
+            _DISCOVERY_CACHE.clear()
+            _DISCOVERY_CACHE.update(cache)
+            _save_discovery_cache(cache)
+
+        return {str(k): ext_dict[k] for k in sorted(ext_dict)}
 
     def extension_submenu(self, **kwargs):
-        ExtensionSubmenu(kwargs.get("opt_data"), self.__class__).run()
+        extension = kwargs.get("opt_data")
+        try:
+            submenu = ExtensionSubmenu(extension, self.__class__)
+        except ImportError as e:
+            Logger.print_error(f"Failed loading extension: {e}")
+            return
+        submenu.run()
 
     def bulk_install_extensions(self, **kwargs):
         """Allow user to select multiple extensions for installation"""
-        print("\n" + Color.apply("=== Bulk Extension Installation ===", Color.CYAN))
+        print(f"\n{_HDR_BULK}")
         print("\nAvailable extensions:")
         
         # Display extensions with selection numbers
         for extension in self.extensions.values():
-            index = extension.metadata.get("index")
-            name = extension.metadata.get("display_name")
+            index = extension.index
+            name = extension.display_name
             print(f"  {index}) {name}")
         
-        print(f"\n{Color.apply('Instructions:', Color.YELLOW)}")
+        print(f"\n{_HDR_INSTR}")
         print("  - Enter extension numbers separated by spaces (e.g., 1 3 5)")
         print("  - Enter 'all' to select all extensions")
         print("  - Enter 'done' when finished selecting")
         
-        selected_extensions = []
+        selected_extensions: Dict[str, _LazyExtension] = {}
         
         while True:
-            selection = input(Color.apply("Select extensions (or 'done' to proceed): ", Color.CYAN)).strip()
+            selection = input(_PROMPT_SELECT).strip()
             
             if selection.lower() == 'done':
                 break
             elif selection.lower() == 'all':
-                selected_extensions = list(self.extensions.values())
+                selected_extensions = dict(self.extensions)
                 print(f"Selected all {len(selected_extensions)} extensions")
                 break
             else:
                 # Parse individual selections
-                try:
-                    indices = selection.split()
-                    temp_selected = []
-                    for idx in indices:
-                        if idx in self.extensions:
-                            ext = self.extensions[idx]
-                            if ext not in temp_selected:
-                                temp_selected.append(ext)
-                                print(f"Added: {ext.metadata.get('display_name')}")
-                            else:
-                                print(f"Already selected: {ext.metadata.get('display_name')}")
-                        else:
-                            print(f"Invalid extension number: {idx}")
-                    
-                    if temp_selected:
-                        for ext in temp_selected:
-                            if ext not in selected_extensions:
-                                selected_extensions.append(ext)
-                        
-                        print(f"\nCurrently selected ({len(selected_extensions)}):")
-                        for ext in selected_extensions:
-                            print(f"  - {ext.metadata.get('display_name')}")
-                
-                except Exception as e:
-                    print(f"Invalid input format. Please try again.")
-        
+                temp_selected: Dict[str, _LazyExtension] = {}
+                for idx in selection.split():
+                    if not idx.isdigit() or idx not in self.extensions:
+                        print(f"Invalid extension number: {idx}")
+                        continue
+
+                    ext = self.extensions[idx]
+                    if idx not in temp_selected:
+                        temp_selected[idx] = ext
+                        print(f"Added: {ext.display_name}")
+                    else:
+                        print(f"Already selected: {ext.display_name}")
+
+                if temp_selected:
+                    selected_extensions.update(temp_selected)
+
+                    print(f"\nCurrently selected ({len(selected_extensions)}):")
+                    for ext in selected_extensions.values():
+                        print(f"  - {ext.display_name}")
+
         if not selected_extensions:
             print("No extensions selected.")
             return
         
         # Confirm installation
-        print(f"\n{Color.apply('Selected extensions for installation:', Color.YELLOW)}")
-        for ext in selected_extensions:
-            print(f"  - {ext.metadata.get('display_name')}")
+        print(f"\n{_HDR_SELECTED}")
+        for ext in selected_extensions.values():
+            print(f"  - {ext.display_name}")
         
         if get_confirm("Proceed with installation?", True):
-            self._install_selected_extensions(selected_extensions)
+            self._install_selected_extensions(list(selected_extensions.values()))
         else:
             print("Installation cancelled.")
 
-    def _install_selected_extensions(self, extensions: List[BaseExtension]):
-        """Install the selected extensions one by one"""
+    def _install_selected_extensions(self, extensions: List[_LazyExtension]):
+        """
+        Install the selected extensions in the order they were selected.
+        Consecutive extensions flagged as "parallel_safe" in their metadata
+        are installed concurrently, all others one by one.
+        """
         total = len(extensions)
         successful = 0
         failed = []
+        position = 0
         
-        print(f"\n{Color.apply('Starting bulk installation...', Color.GREEN)}")
+        print(f"\n{_HDR_START}")
         print(f"Installing {total} extension(s)\n")
-        
-        for i, extension in enumerate(extensions, 1):
-            name = extension.metadata.get('display_name')
-            print(f"[{i}/{total}] Installing {name}...")
-            
-            try:
-                extension.install_extension()
+
+        def install(extension: _LazyExtension) -> None:
+            # resolving the installer may import the extension module, which
+            # has to happen here, so that import errors are reported as failures
+            extension.install_extension()
+
+        def report(name: str, error: BaseException | None) -> None:
+            nonlocal successful
+            if error is None:
                 successful += 1
                 Logger.print_ok(f"✓ {name} installed successfully")
-            except Exception as e:
+            else:
                 failed.append(name)
-                Logger.print_error(f"✗ Failed to install {name}: {e}")
-            
+                Logger.print_error(f"✗ Failed to install {name}: {error}")
             print()  # Add spacing between installations
+
+        def install_parallel(batch: List[_LazyExtension]) -> None:
+            nonlocal position
+            names = [e.display_name or e.module_path for e in batch]
+            for name in names:
+                position += 1
+                print(f"[{position}/{total}] Installing {name}...")
+            print()
+
+            with ThreadPoolExecutor(max_workers=min(4, len(batch))) as executor:
+                futures = [executor.submit(install, e) for e in batch]
+                for name, future in zip(names, futures):
+                    report(name, future.exception())
+
+        batch: List[_LazyExtension] = []
+        for extension in extensions:
+            if extension.metadata.get("parallel_safe", False):
+                batch.append(extension)
+                continue
+            if batch:
+                install_parallel(batch)
+                batch = []
+
+            position += 1
+            name = extension.display_name or extension.module_path
+            print(f"[{position}/{total}] Installing {name}...")
+            
+            try:
+                install(extension)
+                report(name, None)
+            except Exception as e:
+                report(name, e)
+        if batch:
+            install_parallel(batch)
         
         # Installation summary
-        print(Color.apply("=== Installation Summary ===", Color.CYAN))
+        print(_HDR_SUMMARY)
         print(f"Total extensions: {total}")
         print(Color.apply(f"Successful: {successful}", Color.GREEN))
         
@@ -188,39 +355,26 @@ class ExtensionsMenu(BaseMenu):
             for name in failed:
                 print(f"  - {name}")
         else:
-            print(Color.apply("All extensions installed successfully! 🎉", Color.GREEN))
+            print(_MSG_ALL_OK)
 
     def print_menu(self) -> None:
-        line1 = Color.apply("Available Extensions:", Color.YELLOW)
-        line2 = Color.apply("I) Bulk Install Extensions", Color.GREEN)
-        menu = textwrap.dedent(
-            f"""
-            ╟───────────────────────────────────────────────────────╢
-            ║ {line1:<62} ║
-            ║                                                       ║
-            """
-        )[1:]
-        print(menu, end="")
-
+        rows: List[str] = [_MENU_HEADER]
+        rows_append = rows.append
         for extension in self.extensions.values():
-            index = extension.metadata.get("index")
-            name = extension.metadata.get("display_name")
-            row = f"{index}) {name}"
-            print(f"║ {row:<53} ║")
-        
-        print("║                                                       ║")
-        print(f"║ {line2:<62} ║")
-        print("╟───────────────────────────────────────────────────────╢")
+            rows_append(_ROW(f"{extension.index}) {extension.display_name}"))
+        rows_append(_MENU_FOOTER)
+
+        print("".join(rows), end="")
 
 
 # noinspection PyUnusedLocal
 # noinspection PyMethodMayBeStatic
 class ExtensionSubmenu(BaseMenu):
     def __init__(
-        self, extension: BaseExtension, previous_menu: Type[BaseMenu] | None = None
+        self, extension: _LazyExtension, previous_menu: Type[BaseMenu] | None = None
     ):
         super().__init__()
-        self.title = extension.metadata.get("display_name")
+        self.title = extension.display_name
         self.title_color = Color.YELLOW
         self.extension = extension
         self.previous_menu: Type[BaseMenu] | None = previous_menu
@@ -248,11 +402,7 @@ class ExtensionSubmenu(BaseMenu):
             border_right="║",
         )
 
-        menu = textwrap.dedent(
-            """
-            ╟───────────────────────────────────────────────────────╢
-            """
-        )[1:]
+        menu = _MENU_MID_SEP
         menu += f"{description_text}\n"
 
         # add links if available
@@ -272,25 +422,17 @@ class ExtensionSubmenu(BaseMenu):
                 border_right="║",
             )
 
-            menu += textwrap.dedent(
-                """
-                ╟───────────────────────────────────────────────────────╢
-                """
-            )[1:]
+            menu += _MENU_MID_SEP
             menu += f"{links_text}\n"
 
-        menu += textwrap.dedent(
-            """
-            ╟───────────────────────────────────────────────────────╢
-            ║ 1) Install                                            ║
-            """
-        )[1:]
+        menu += _MENU_MID_SEP
+        menu += "║ 1) Install                                            ║\n"
 
         if self.extension.metadata.get("updates"):
             menu += "║ 2) Update                                             ║\n"
             menu += "║ 3) Remove                                             ║\n"
         else:
             menu += "║ 2) Remove                                             ║\n"
-        menu += "╟───────────────────────────────────────────────────────╢\n"
+        menu += _MENU_MID_SEP
 
         print(menu, end="")